@@ -26,20 +26,56 @@ and customize with your settings.
 """
 
 import argparse
+import atexit
+import functools
+import hashlib
+import mmap
 import os
+import pickle
+import queue
+import random
 import sys
 import re
+import signal
 import time
+import traceback
 import json
+import math
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 import smtplib
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import yfinance as yf
 from twilio.rest import Client
+from yfinance import shared as yf_shared
+
+try:
+    from yfinance.exceptions import YFRateLimitError
+except ImportError:  # yfinance < 0.2.52
+    class YFRateLimitError(Exception):
+        """Stand-in for yfinance versions without a dedicated rate-limit error."""
+
+try:
+    import numexpr as ne  # Optional: fuses the RSI arithmetic into a single pass
+except ImportError:
+    ne = None
+
+try:
+    import talib  # Optional: TA-Lib's C implementation of RSI is used when installed
+except ImportError:
+    talib = None
+
+try:
+    from numba import njit, prange  # Optional: compiles the Wilder recurrence into a parallel loop
+except ImportError:
+    njit = None
 
 # Try to load local configuration
 try:
@@ -50,26 +86,177 @@ try:
         TWILIO_PHONE_NUMBER, TWILIO_TO_NUMBER,
     )
 except ImportError:
-    print("\nWarning: Local configuration not found.")
-    print("Please copy config.template.py to config.local.py and customize with your settings.")
-    print("See config.template.py for instructions.\n")
+    print("\nWarning: Local configuration not found.", file=sys.stderr)
+    print("Please copy config.template.py to config.local.py and customize with your settings.", file=sys.stderr)
+    print("See config.template.py for instructions.\n", file=sys.stderr)
     sys.exit(1)
 
 # Default notification settings
 DEFAULT_EMAIL_FROM = 'rsi-screener@localhost'
 
+# On-disk cache of downloaded bars, one parquet file per (symbol, period, interval)
+_CACHE_DIR = Path("~/.rsi_cache").expanduser()
+_cache_mem: dict[Path, tuple[float, pd.Series]] = {}  # path -> (mtime, parsed closes)
+
+# Cached bars younger than this are used without contacting Yahoo at all
+_INTRADAY_CACHE_TTL = 60
+_DAILY_CACHE_TTL = 15 * 60
+
+# Symbols Yahoo reported as having no data aren't re-requested for this long
+_NO_DATA_TTL = 10 * 60
+# yf.download error text for a symbol with no data (as opposed to a network or rate-limit failure)
+_NO_DATA_ERROR = re.compile(r'delisted|no (price )?data found|no timezone found', re.IGNORECASE)
+_no_data: dict[tuple[str, str, str], float] = {}  # (symbol, period, interval) -> time seen empty
+
+_PERIOD_UNITS = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+
+# Ticker validation results are reused for a day, across restarts
+_VALIDATE_TTL = 24 * 60 * 60
+_VALIDATE_CACHE_FILE = _CACHE_DIR / "validate.pkl"
+
+# Symbols per batched yf.download request. Halved (down to _MIN_DOWNLOAD_CHUNK) when
+# Yahoo rate-limits us, and the reduced size is kept for later downloads.
+_DOWNLOAD_CHUNK = 20
+_MIN_DOWNLOAD_CHUNK = 5
+_RATE_LIMIT_RETRIES = 5
+_chunk_size = _DOWNLOAD_CHUNK
+# yf.download error text for a throttled request
+_RATE_LIMIT_ERROR = re.compile(r'YFRateLimitError|Too Many Requests|Rate limited')
+
+# Set by Ctrl+C in continuous mode; also cuts short a rate-limit backoff
+_stop = threading.Event()
+
+# Yahoo's bulk quote endpoint, used to validate many tickers per request
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+_CRUMB_URL = "https://query1.finance.yahoo.com/v1/test/getcrumb"
+_QUOTE_CHUNK = 20
+_crumb = None
+
+# Upper bound on concurrent per-ticker HTTP requests (validation lookups)
+_MAX_WORKERS = 32
+
+# One keep-alive session shared by all Yahoo requests, so TCP/TLS setup is paid once.
+# Newer yfinance releases only accept curl_cffi sessions, so prefer one when installed.
+try:
+    from curl_cffi import requests as curl_requests
+    _SESSION = curl_requests.Session(impersonate="chrome")
+except ImportError:
+    _SESSION = requests.Session()
+    _SESSION.mount('https://', HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=3))
+
+# Repeat alerts for a ticker are suppressed for this long unless its signal changes
+_ALERT_SUPPRESS_WINDOW = 60 * 60
+_last_sent: dict[str, tuple[float, str]] = {}  # ticker -> (time sent, signal)
+
 # Custom RSI calculation instead of using pandas_ta
 def calculate_rsi(data, window=14):
-    """Calculate RSI directly without pandas_ta dependency. Assumes input is a pandas Series."""
+    """Calculate Wilder's RSI directly without pandas_ta dependency. Assumes input is a pandas Series."""
     # The input 'data' should already be the 'Close' price Series
-    
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
-    
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    return pd.Series(_rsi_vectorized(data.to_numpy(dtype=np.float32), window), index=data.index)
+
+
+def _rsi_vectorized(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """Wilder's RSI along axis 0 of a float array of closes, keeping the input dtype (float32 in practice).
+
+    A 2-D (time, ticker) array computes every ticker in one pass; columns may be
+    padded with leading NaNs to a common length.
+    """
+    if close.shape[0] <= window:
+        # Not enough bars for a single RSI value (the first comes at index window); skip the smoothing
+        return np.full(close.shape, np.nan, dtype=close.dtype)
+    if talib is not None:
+        return _rsi_talib(close, window)
+    return _rsi_from_averages(*_wilder_averages(close, window))
+
+
+def _wilder_averages(close: np.ndarray, window: int = 14):
+    """Wilder-smoothed average gain and loss along axis 0, same layout rules as _rsi_vectorized.
+
+    Uses the same definition as TA-Lib's RSI, so results don't depend on whether it's
+    installed: the averages are seeded with the simple mean of a column's first `window`
+    changes, and the first value is at `window` bars after the column's first close.
+    """
+    if njit is not None:
+        mat = close.reshape(close.shape[0], -1)
+        avg_gain = np.empty_like(mat)
+        avg_loss = np.empty_like(mat)
+        _wilder_kernel(mat, window, avg_gain, avg_loss)
+        return avg_gain.reshape(close.shape), avg_loss.reshape(close.shape)
+
+    rows = close.shape[0]
+    delta = np.diff(close, axis=0, prepend=close[:1]).reshape(rows, -1)
+    cols = delta.shape[1]
+    # Gains and losses side by side, so a single ewm call smooths both; written in place.
+    # fmax turns the NaN changes in the leading padding into zeros.
+    moves = np.empty((rows, 2 * cols), dtype=delta.dtype)
+    np.fmax(delta, 0, out=moves[:, :cols])
+    np.negative(delta, out=moves[:, cols:])
+    np.fmax(moves[:, cols:], 0, out=moves[:, cols:])
+
+    # Seed row = mean of the preceding `window` changes; earlier rows are masked out of the EMA
+    if not np.isnan(close[0]).any():
+        # No padding (padding is leading-only): every column is seeded at row `window`,
+        # so plain slices do it without per-column masks or a cumulative sum
+        if rows > window:
+            moves[window] = moves[1:window + 1].mean(axis=0, dtype=np.float64)
+        moves[:window] = np.nan
+    else:
+        # Each column's first value is at `window` bars past its first close
+        first = np.isnan(close.reshape(rows, -1)).sum(axis=0) + window
+        first = np.concatenate([first, first])
+        csum = np.cumsum(moves, axis=0, dtype=np.float64)
+        cidx = np.flatnonzero(first < rows)
+        seed = (csum[first[cidx], cidx] - csum[first[cidx] - window, cidx]) / window
+        moves[np.arange(rows)[:, None] < first] = np.nan
+        moves[first[cidx], cidx] = seed
+
+    # From the seed on, Wilder's smoothing is an EMA with alpha = 1/window, applied to every column at once
+    avg = pd.DataFrame(moves).ewm(alpha=1 / window, adjust=False).mean().to_numpy(dtype=close.dtype)
+    avg_gain = avg[:, :cols].reshape(close.shape)
+    avg_loss = avg[:, cols:].reshape(close.shape)
+    return avg_gain, avg_loss
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _wilder_kernel(close, window, avg_gain, avg_loss):
+        """Fill avg_gain/avg_loss for a (time, ticker) matrix, one ticker per thread.
+
+        Matches the ewm path: the averages are seeded with the mean of the first
+        `window` changes, and values stay NaN until then.
+        """
+        rows, cols = close.shape
+        alpha = 1.0 / window
+        keep = 1.0 - alpha
+        for j in prange(cols):
+            start = 0
+            while start < rows and np.isnan(close[start, j]):
+                start += 1
+            gain = 0.0
+            loss = 0.0
+            for t in range(rows):
+                if t > start:
+                    delta = close[t, j] - close[t - 1, j]
+                    if t - start <= window:
+                        gain += max(delta, 0.0) / window
+                        loss += max(-delta, 0.0) / window
+                    else:
+                        gain = keep * gain + alpha * max(delta, 0.0)
+                        loss = keep * loss + alpha * max(-delta, 0.0)
+                if t - start < window:
+                    avg_gain[t, j] = np.nan
+                    avg_loss[t, j] = np.nan
+                else:
+                    avg_gain[t, j] = gain
+                    avg_loss[t, j] = loss
+
+
+def _rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    if ne is not None:
+        return ne.evaluate("100 - 100 / (1 + avg_gain / avg_loss)")
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = avg_gain / avg_loss
+    return 100 - (100 / (1 + rs))
 
 
 # ----------------------------------------------------------------------
@@ -77,71 +264,400 @@ def parse_ticker_file(path: str) -> list[str]:
     """Read a file and extract tickers separated by commas, whitespace or newlines."""
     if not os.path.exists(path):
         sys.exit(f"Ticker file not found: {path}")
-    with open(path, "r", encoding="utf-8") as fh:
-        data = fh.read()
-    # split on comma or whitespace, remove empties, uppercase
-    return [tok.upper() for tok in re.split(r"[,\s]+", data.strip()) if tok]
+    with open(path, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return []
+        # Map the file instead of reading it, so large universes aren't copied into memory first
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, "madvise"):  # Not available on Windows
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            # split on comma or whitespace line by line; bytes.split() already drops empties
+            tokens = [tok for line in iter(mm.readline, b"") for tok in line.replace(b",", b" ").split()]
+    return [tok.decode("utf-8").upper() for tok in tokens]
+
+
+def _period_offset(period: str):
+    """Convert a yfinance period string (e.g. 90d, 6mo, 1y) to a DateOffset, or None for max/ytd."""
+    m = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if not m:
+        return None
+    return pd.DateOffset(**{_PERIOD_UNITS[m.group(2)]: int(m.group(1))})
+
+
+def _cache_ttl(interval: str) -> int:
+    """Seconds a cached history stays fresh: short for intraday bars (1m, 1h, ...), longer for daily and up."""
+    return _INTRADAY_CACHE_TTL if interval.endswith(('m', 'h')) else _DAILY_CACHE_TTL
+
+
+def _cache_path(symbol: str, period: str, interval: str) -> Path:
+    # Hash the key so symbols like ^GSPC or BRK/B always make valid file names
+    key = hashlib.md5(f"{symbol}|{period}|{interval}".encode()).hexdigest()
+    return _CACHE_DIR / f"{key}.parquet"
+
+
+def load_cached_closes(symbol: str, period: str, interval: str):
+    """Return (Close series, mtime) from the cache, or (None, None) if there is no usable cache."""
+    path = _cache_path(symbol, period, interval)
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None, None
+
+    # Only re-parse the parquet file when it changed on disk
+    cached = _cache_mem.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1], mtime
+    try:
+        close = pd.read_parquet(path)['Close']
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache file {path}: {str(e)}", file=sys.stderr)
+        return None, None
+    _cache_mem[path] = (mtime, close)
+    return close, mtime
+
+
+def save_cached_closes(symbol: str, period: str, interval: str, close: pd.Series):
+    """Write a symbol's Close series to the on-disk cache."""
+    path = _cache_path(symbol, period, interval)
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        close.to_frame('Close').to_parquet(path)
+        _cache_mem[path] = (path.stat().st_mtime, close)
+    except Exception as e:
+        print(f"Warning: Could not write cache file {path}: {str(e)}", file=sys.stderr)
+
 
+def _download_closes(symbols: list[str], no_data: "set[str] | None" = None, **kwargs) -> dict[str, pd.Series]:
+    """Download bars for all symbols in batched requests and return their Close series.
 
-def fetch_rsi(symbol: str, period: str, interval: str, length: int = 14):
-    """Return last close and RSI value."""
+    Symbols Yahoo answered with "no data" / "delisted" are added to `no_data` if given.
+    """
+    global _chunk_size
+    closes = {}
+    # Yahoo handles at most ~20 symbols per request well, so split larger lists.
+    # Chunks run one after another: yf.download collects results in module-global
+    # state, so concurrent calls would clobber each other (each call is threaded already).
+    i = 0
+    retries = 0
+    while i < len(symbols):
+        try:
+            closes.update(_download_chunk(symbols[i:i + _chunk_size], no_data, **kwargs))
+        except YFRateLimitError:
+            retries += 1
+            if retries > _RATE_LIMIT_RETRIES:
+                print("Error downloading data: still rate limited by Yahoo, skipping remaining tickers", file=sys.stderr)
+                break
+            _chunk_size = max(_MIN_DOWNLOAD_CHUNK, _chunk_size // 2)
+            delay = random.uniform(3, 5)  # Jitter so retries don't hit the limiter in lockstep
+            print(f"Rate limited by Yahoo; retrying in {delay:.1f}s with {_chunk_size} tickers per request", file=sys.stderr)
+            if _stop.wait(delay):
+                break
+            continue
+        i += _chunk_size
+        retries = 0
+    return closes
+
+
+def _download_chunk(symbols: list[str], no_data: "set[str] | None" = None, **kwargs) -> dict[str, pd.Series]:
+    """Download bars for one chunk of symbols in one request. Raises YFRateLimitError if throttled."""
     # Explicitly set auto_adjust=False to ensure 'Close' column is present
-    df = yf.download(symbol, period=period, interval=interval, progress=False, threads=False, auto_adjust=False)
+    df = yf.download(symbols, group_by='ticker', progress=False, threads=True,
+                     auto_adjust=False, session=_SESSION, **kwargs)
+    # yf.download logs per-ticker failures instead of raising them
+    errors = getattr(yf_shared, '_ERRORS', {})
+    if any(_RATE_LIMIT_ERROR.search(str(errors.get(symbol, ''))) for symbol in symbols):
+        raise YFRateLimitError()
+    if no_data is not None:
+        no_data.update(symbol for symbol in symbols if _NO_DATA_ERROR.search(str(errors.get(symbol, ''))))
+    closes = {}
     if df.empty:
-        raise ValueError("no data")
-    
-    # Check if 'Close' column exists and get the last close value first
-    if 'Close' not in df.columns:
-        print(f"DEBUG: 'Close' column not found for {symbol}. Available columns: {df.columns.tolist()}")
-        raise KeyError("'Close' column missing in downloaded data")
-    
-    # Check if all Close values are NaN explicitly
-    all_nan = df['Close'].isnull().all()
-    # Use .item() to extract the single boolean value from the Series
-    if all_nan.item(): 
-        raise ValueError(f"'Close' column contains only NaN values for {symbol}")
-        
-    # Ensure last_close is a scalar before checking pd.isna
-    last_close_val = df['Close'].iloc[-1]
-    if isinstance(last_close_val, pd.Series):
-        last_close_val = last_close_val.item()
-
-    if pd.isna(last_close_val):
-        # If the very last close is NaN, try to find the last valid one
-        last_valid_close = df['Close'].dropna().iloc[-1]
-        if isinstance(last_valid_close, pd.Series): # Also ensure this is scalar
-            last_valid_close = last_valid_close.item()
-            
-        if pd.notna(last_valid_close):
-            last_close_val = last_valid_close
-            print(f"Warning: Last close for {symbol} was NaN, using last valid price: {last_close_val:.2f}")
+        return closes
+
+    for symbol in symbols:
+        # Batched downloads come back with (ticker, field) MultiIndex columns
+        if isinstance(df.columns, pd.MultiIndex):
+            if symbol not in df.columns.get_level_values(0):
+                continue
+            frame = df[symbol]
+        else:
+            frame = df
+        if 'Close' not in frame.columns:
+            print(f"DEBUG: 'Close' column not found for {symbol}. Available columns: {frame.columns.tolist()}", file=sys.stderr)
+            continue
+        # Rows are aligned across exchanges, so drop the gaps from other calendars
+        closes[symbol] = frame['Close'].dropna()
+    return closes
+
+
+def fetch_all(symbols: list[str], period: str, interval: str) -> dict[str, pd.Series]:
+    """Return Close series for all symbols, downloading only the bars missing from the cache."""
+    now = time.time()
+    ttl = _cache_ttl(interval)
+    closes = {}
+    missing = []
+    stale = []
+    for symbol in symbols:
+        if now - _no_data.get((symbol, period, interval), 0) < _NO_DATA_TTL:
+            continue  # Recently came back empty; don't ask again yet
+        cached, mtime = load_cached_closes(symbol, period, interval)
+        if cached is None or cached.empty:
+            missing.append(symbol)
         else:
-            raise ValueError(f"Could not find any valid 'Close' price for {symbol}")
+            closes[symbol] = cached
+            if now - mtime >= ttl:
+                stale.append(symbol)
+
+    updated = {}
+    if missing:
+        no_data = set()
+        updated.update(_download_closes(missing, no_data, period=period, interval=interval))
+        # Only Yahoo saying there's no data is cached; network errors and rate-limit
+        # give-ups leave the symbol to be retried on the next call
+        for symbol in no_data:
+            _no_data[(symbol, period, interval)] = now
+    if stale:
+        # Re-fetch from the bar before the last cached one: the last may still have been
+        # in progress, and the completed one before it shows whether history was revised
+        start = min(closes[symbol].index[max(-2, -len(closes[symbol]))] for symbol in stale)
+        no_data = set()
+        fresh = _download_closes(stale, no_data, start=start, interval=interval)
+        offset = _period_offset(period)
+        revised = []
+        for symbol in stale:
+            new = fresh.get(symbol)
+            if new is None:
+                if symbol in no_data:
+                    # Nothing new (e.g. market closed); rewrite so the TTL restarts
+                    updated[symbol] = closes[symbol]
+                else:
+                    # The refresh failed: serve the cached bars this time, but retry on the next call
+                    print(f"Warning: Could not refresh {symbol}, using cached data", file=sys.stderr)
+                continue
+            if len(closes[symbol]) > 1:
+                anchor = closes[symbol].index[-2]
+                if anchor not in new.index or not np.isclose(new[anchor], closes[symbol][anchor], rtol=1e-4):
+                    # A split or data revision re-adjusted older bars; appending would mix the two
+                    revised.append(symbol)
+                    continue
+            merged = pd.concat([closes[symbol], new])
+            merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+            if offset is not None:
+                merged = merged[merged.index > merged.index[-1] - offset]
+            updated[symbol] = merged
+        if revised:
+            full = _download_closes(revised, period=period, interval=interval)
+            for symbol in revised:
+                if symbol in full and not full[symbol].empty:
+                    updated[symbol] = full[symbol]
+                else:
+                    print(f"Warning: Could not reload revised history for {symbol}, using cached data", file=sys.stderr)
 
-    # Calculate RSI using our custom function, passing the Close Series
-    rsi_series = calculate_rsi(df['Close'], window=length)
-    last_rsi = rsi_series.iloc[-1]
-    if isinstance(last_rsi, pd.Series): # Ensure last_rsi is scalar too
-        last_rsi = last_rsi.item()
+    for symbol, close in updated.items():
+        if not close.empty:
+            save_cached_closes(symbol, period, interval, close)
+            closes[symbol] = close
+    return closes
+
+
+def _rsi_talib(close: np.ndarray, window: int = 14) -> np.ndarray:
+    """TA-Lib RSI with the same shape/dtype contract as _rsi_vectorized (TA-Lib is 1-D float64 only)."""
+    mat = close.reshape(close.shape[0], -1)
+    rsi = np.column_stack([talib.RSI(np.ascontiguousarray(col, dtype=np.float64), timeperiod=window)
+                           for col in mat.T])
+    # TA-Lib reports 0 where price hasn't moved at all; the fallback reports NaN (no signal)
+    rsi[np.fmax.accumulate(mat, axis=0) == np.fmin.accumulate(mat, axis=0)] = np.nan
+    return rsi.reshape(close.shape).astype(close.dtype)
+
+
+def _valid_closes(symbol: str, close: pd.Series):
+    """Return the non-NaN closes of a series as a float32 array, their timestamps, and the last price.
+
+    The float32 array is only for the RSI arithmetic; the price is read from the original
+    float64 series, since float32 can't hold cents on large prices.
+    """
+    # Work on the raw array to avoid pandas label indexing and scalar boxing
+    # RSI doesn't need float64 precision; float32 halves the memory traffic
+    closes = close.to_numpy(dtype=np.float32).ravel()
+    mask = ~np.isnan(closes)
+    if closes.size and mask.all():
+        return closes, close.index, float(close.iloc[-1])  # The usual case: no gaps, so no filtering copies
+    valid = closes[mask]
+    if valid.size == 0:
+        raise ValueError(f"'Close' column contains only NaN values for {symbol}")
 
-    return float(last_close_val), float(last_rsi)
+    price = float(close.iloc[np.flatnonzero(mask)[-1]])
+    if np.isnan(closes[-1]):
+        # If the very last close is NaN, fall back to the last valid one
+        print(f"Warning: Last close for {symbol} was NaN, using last valid price: {price:.2f}", file=sys.stderr)
+    return valid, close.index[mask], price
 
 
-def calculate_rsi_for_ticker(ticker, period="1mo", interval="1d", rsi_length=14):
-    """Calculate RSI for a given ticker"""
+def _stack_closes(arrays: list[np.ndarray]) -> np.ndarray:
+    """Right-align closes arrays into a (time, ticker) matrix so the last row holds every latest bar."""
+    rows = max(arr.size for arr in arrays)
+    close_mat = np.full((rows, len(arrays)), np.nan, dtype=np.float32)
+    for j, arr in enumerate(arrays):
+        close_mat[rows - arr.size:, j] = arr
+    return close_mat
+
+
+# Wilder smoothing factors for the standard 14-bar RSI, so the per-bar update is two multiplies
+_ALPHA = 1.0 / 14
+_KEEP = 13.0 / 14
+
+
+def _rsi_step(avg_gain: float, avg_loss: float, prev_close: float, close: float, length: int = 14):
+    """Advance Wilder's averages by one bar."""
+    delta = close - prev_close
+    if length == 14:
+        return avg_gain * _KEEP + max(delta, 0.0) * _ALPHA, avg_loss * _KEEP + max(-delta, 0.0) * _ALPHA
+    avg_gain = (avg_gain * (length - 1) + max(delta, 0.0)) / length
+    avg_loss = (avg_loss * (length - 1) + max(-delta, 0.0)) / length
+    return avg_gain, avg_loss
+
+
+def _scalar_rsi(avg_gain: float, avg_loss: float) -> float:
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else float('nan')
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def _advance_rsi_state(state, ticker, closes, timestamps, length=14):
+    """Update a ticker's saved Wilder state with newly completed bars and return its current RSI.
+
+    state[ticker] holds (timestamp, avg_gain, avg_loss, close) as of the last completed
+    bar, i.e. the one before the still-forming latest bar. Returns None when the saved
+    state can't be continued (missing, or history revised/trimmed) and a full recompute is needed.
+    """
+    saved = state.get(ticker)
+    if saved is None:
+        return None
+    ts, avg_gain, avg_loss, prev_close = saved
+    pos = timestamps.searchsorted(ts)
+    if pos >= closes.size - 1 or timestamps[pos] != ts or closes[pos] != prev_close:
+        return None
+
+    # Fold in bars that completed since the last check, then step to the live bar
+    for i in range(pos + 1, closes.size - 1):
+        avg_gain, avg_loss = _rsi_step(avg_gain, avg_loss, prev_close, float(closes[i]), length)
+        prev_close = float(closes[i])
+    state[ticker] = (timestamps[-2], avg_gain, avg_loss, prev_close)
+    return _scalar_rsi(*_rsi_step(avg_gain, avg_loss, prev_close, float(closes[-1]), length))
+
+
+def _now_str():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _rsi_result(ticker, price, rsi, now_str):
+    return {
+        'ticker': ticker,
+        'rsi': rsi,
+        'price': price,
+        'time': now_str
+    }
+
+
+def calculate_rsi_for_tickers(symbols, period="1mo", interval="1d", rsi_length=14, state=None, debug=False,
+                              now_str=None):
+    """Calculate RSI for all tickers from a single batched download.
+
+    Pass the same `state` dict on every call (continuous mode) to keep each ticker's
+    Wilder averages between calls, so later calls only step over new bars.
+    Every result is stamped with `now_str` (default: the time of the call).
+    """
+    now_str = now_str or _now_str()
     try:
-        close, rsi = fetch_rsi(ticker, period, interval, rsi_length)
-        return {
-            'ticker': ticker,
-            'rsi': rsi,
-            'price': close,
-            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        }
+        closes = fetch_all(symbols, period, interval)
     except Exception as e:
-        import traceback
-        print(f"Error calculating RSI for {ticker}:")
-        traceback.print_exc() # Print full traceback for better debugging
-        return None
+        print(f"Error downloading data: {type(e).__name__}: {e}", file=sys.stderr)
+        if debug:
+            traceback.print_exc()
+        closes = {}
+    results = {}
+    arrays = {}
+    for ticker in symbols:
+        try:
+            if ticker not in closes:
+                raise ValueError("no data")
+            arrays[ticker] = _valid_closes(ticker, closes[ticker])
+        except ValueError as e:
+            print(f"Error calculating RSI for {ticker}: {type(e).__name__}: {e}", file=sys.stderr)
+            if debug:
+                traceback.print_exc()
+            results[ticker] = None
+
+    if state is not None:
+        for ticker, (arr, timestamps, price) in arrays.items():
+            rsi = _advance_rsi_state(state, ticker, arr, timestamps, rsi_length)
+            if rsi is not None:
+                results[ticker] = _rsi_result(ticker, price, rsi, now_str)
+
+    remaining = [t for t in arrays if t not in results]
+    if not remaining:
+        return results
+    close_mat = _stack_closes([arrays[t][0] for t in remaining])
+    if state is None:
+        last_rsi = _rsi_vectorized(close_mat, rsi_length)[-1]
+    else:
+        # Full recompute, keeping the averages at the last completed bar for next time
+        avg_gain, avg_loss = _wilder_averages(close_mat, rsi_length)
+        last_rsi = _rsi_from_averages(avg_gain[-1], avg_loss[-1])
+        if close_mat.shape[0] > 1:
+            for j, ticker in enumerate(remaining):
+                arr, timestamps, _ = arrays[ticker]
+                if arr.size > 1 and not np.isnan(avg_gain[-2, j]):
+                    state[ticker] = (timestamps[-2], float(avg_gain[-2, j]), float(avg_loss[-2, j]), float(arr[-2]))
+    for ticker, rsi in zip(remaining, last_rsi):
+        results[ticker] = _rsi_result(ticker, arrays[ticker][2], float(rsi), now_str)
+    return results
+
+
+# A single SMTP connection is kept open and reused across alerts
+_SMTP_TIMEOUT = 10
+_smtp = None
+_smtp_lock = threading.Lock()
+
+
+def _connect_smtp():
+    print(f"Connecting to SMTP server {EMAIL_HOST}:{EMAIL_PORT}...")
+    if EMAIL_USE_TLS:
+        server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT, timeout=_SMTP_TIMEOUT)
+        server.ehlo()
+        server.starttls()
+        server.ehlo()
+    else: # Assumes SSL or no encryption (adjust if SSL needed)
+         # For SSL use smtplib.SMTP_SSL(EMAIL_HOST, EMAIL_PORT)
+         # Might need separate config var for SSL vs TLS vs None
+         server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT, timeout=_SMTP_TIMEOUT)
+         
+    server.login(EMAIL_USER, EMAIL_PASSWORD)
+    return server
+
+
+@atexit.register
+def _close_smtp():
+    global _smtp
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        _smtp = None
+
+
+def _get_smtp():
+    """Return the open SMTP connection, reconnecting if the server dropped it. Hold _smtp_lock."""
+    global _smtp
+    if _smtp is not None:
+        try:
+            if _smtp.noop()[0] == 250:
+                return _smtp
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp()
+    _smtp = _connect_smtp()
+    return _smtp
 
 
 def alert_email(subject: str, body: str):
@@ -162,31 +678,29 @@ def alert_email(subject: str, body: str):
         msg['From'] = EMAIL_FROM
         msg['To'] = EMAIL_TO
         
-        # Connect to the SMTP server and send
-        print(f"Connecting to SMTP server {EMAIL_HOST}:{EMAIL_PORT}...")
-        if EMAIL_USE_TLS:
-            server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT)
-            server.ehlo()
-            server.starttls()
-            server.ehlo()
-        else: # Assumes SSL or no encryption (adjust if SSL needed)
-             # For SSL use smtplib.SMTP_SSL(EMAIL_HOST, EMAIL_PORT)
-             # Might need separate config var for SSL vs TLS vs None
-             server = smtplib.SMTP(EMAIL_HOST, EMAIL_PORT)
-             
-        server.login(EMAIL_USER, EMAIL_PASSWORD)
-        server.sendmail(EMAIL_FROM, [EMAIL_TO], msg.as_string())
-        server.quit()
+        # Send over the pooled connection, retrying once if it was dropped mid-send
+        with _smtp_lock:
+            try:
+                _get_smtp().sendmail(EMAIL_FROM, [EMAIL_TO], msg.as_string())
+            except smtplib.SMTPServerDisconnected:
+                _close_smtp()
+                _get_smtp().sendmail(EMAIL_FROM, [EMAIL_TO], msg.as_string())
         print("✅ Email alert sent successfully!")
         return True
     except smtplib.SMTPAuthenticationError:
-        print(f"❌ Error sending email: SMTP Authentication failed. Check EMAIL_USER/EMAIL_PASSWORD.")
+        print(f"❌ Error sending email: SMTP Authentication failed. Check EMAIL_USER/EMAIL_PASSWORD.", file=sys.stderr)
         return False
     except Exception as e: # Catch other potential errors
-        print(f"❌ Error sending email alert: {str(e)}")
+        print(f"❌ Error sending email alert: {type(e).__name__}: {e}", file=sys.stderr)
         return False
 
 
+@functools.lru_cache(maxsize=None)
+def _twilio_client():
+    """Twilio client shared across alerts so its HTTP connection is reused."""
+    return Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+
+
 def alert_twilio(message: str):
     """Send SMS alert using Twilio"""
     try:
@@ -195,9 +709,7 @@ def alert_twilio(message: str):
             print("Please set TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_PHONE_NUMBER, and TWILIO_TO_NUMBER")
             return False
         
-        client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
-        
-        message = client.messages.create(
+        message = _twilio_client().messages.create(
             body=message,
             from_=TWILIO_PHONE_NUMBER,
             to=TWILIO_TO_NUMBER
@@ -206,11 +718,80 @@ def alert_twilio(message: str):
         print("✅ SMS alert sent successfully!")
         return True
     except Exception as e:
-        print(f"❌ Error sending SMS alert: {str(e)}")
+        print(f"❌ Error sending SMS alert: {type(e).__name__}: {e}", file=sys.stderr)
         print("Please check your Twilio credentials in config.local.py")
         return False
 
 
+# Alerts are sent by a background thread so SMTP/Twilio latency doesn't block scanning
+_alert_q = queue.Queue()
+
+
+def _alert_worker():
+    while True:
+        sender, args = _alert_q.get()
+        try:
+            sender(*args)
+        except Exception as e:
+            print(f"❌ Error sending alert: {type(e).__name__}: {e}", file=sys.stderr)
+        finally:
+            _alert_q.task_done()
+
+
+threading.Thread(target=_alert_worker, daemon=True).start()
+atexit.register(_alert_q.join)  # Deliver anything still queued before exiting
+
+
+def queue_alert(sender, *args):
+    """Queue an alert to be sent by the background worker, e.g. queue_alert(alert_email, subject, body)"""
+    _alert_q.put((sender, args))
+
+
+class BatchedAlerter:
+    """Coalesce alert lines into one notification, flushed when the batch fills or its window expires."""
+
+    def __init__(self, send, window=30, max_alerts=50):
+        self.send = send  # called with the combined message
+        self.window = window
+        self.max_alerts = max_alerts
+        self._buffer = []
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def add(self, message):
+        with self._lock:
+            self._buffer.append(message)
+            if len(self._buffer) >= self.max_alerts:
+                self._flush_locked()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            message = '\n'.join(self._buffer)
+            self._buffer = []
+            self.send(message)
+
+
+def _is_repeat_alert(ticker, signal):
+    """Return True if this signal was already sent for the ticker within the suppression window."""
+    now = time.time()
+    last = _last_sent.get(ticker)
+    if last and last[1] == signal and now - last[0] < _ALERT_SUPPRESS_WINDOW:
+        return True
+    _last_sent[ticker] = (now, signal)
+    return False
+
+
 def check_rsi_signals(rsi_data, oversold_threshold=30, overbought_threshold=70):
     """Check if RSI is in oversold or overbought territory"""
     if rsi_data is None:
@@ -221,97 +802,237 @@ def check_rsi_signals(rsi_data, oversold_threshold=30, overbought_threshold=70):
     price = rsi_data['price']
     time_str = rsi_data['time']
     
-    if pd.isna(rsi):
+    if math.isnan(rsi):
         return None
         
     signal = None
     if rsi <= oversold_threshold:
         signal = "OVERSOLD"
-        message = f"\n🔵 OVERSOLD ALERT - {time_str}"
-        message += f"\nStock: {ticker}"
-        message += f"\nCurrent Price: ${price:.2f}"
-        message += f"\nRSI: {rsi:.2f} (Below {oversold_threshold})"
-        message += f"\nSignal: Potential Buy Opportunity"
+        if _is_repeat_alert(ticker, signal):
+            return None
+        message = (
+            f"\n🔵 OVERSOLD ALERT - {time_str}"
+            f"\nStock: {ticker}"
+            f"\nCurrent Price: ${price:.2f}"
+            f"\nRSI: {rsi:.2f} (Below {oversold_threshold})"
+            f"\nSignal: Potential Buy Opportunity"
+        )
         print(message)
         return f"⚠️ {ticker} RSI={rsi:.1f} (<{oversold_threshold})"
         
     elif rsi >= overbought_threshold:
         signal = "OVERBOUGHT"
-        message = f"\n🔴 OVERBOUGHT ALERT - {time_str}"
-        message += f"\nStock: {ticker}"
-        message += f"\nCurrent Price: ${price:.2f}"
-        message += f"\nRSI: {rsi:.2f} (Above {overbought_threshold})"
-        message += f"\nSignal: Potential Sell Opportunity"
+        if _is_repeat_alert(ticker, signal):
+            return None
+        message = (
+            f"\n🔴 OVERBOUGHT ALERT - {time_str}"
+            f"\nStock: {ticker}"
+            f"\nCurrent Price: ${price:.2f}"
+            f"\nRSI: {rsi:.2f} (Above {overbought_threshold})"
+            f"\nSignal: Potential Sell Opportunity"
+        )
         print(message)
         return f"⚠️ {ticker} RSI={rsi:.1f} (>{overbought_threshold})"
     
+    # Back in neutral territory, so the next crossing alerts again
+    _last_sent.pop(ticker, None)
     return None
 
 
-def validate_ticker(ticker):
-    """Validate if a ticker is still active and suggest alternatives if needed."""
+def _load_validate_cache() -> dict:
+    """Load persisted validation results, dropping those from expired day buckets."""
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        
-        # Check various error conditions
-        if 'regularMarketPrice' not in info or info['regularMarketPrice'] is None:
-            return False, "No price data available"
+        with open(_VALIDATE_CACHE_FILE, "rb") as fh:
+            cache = pickle.load(fh)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Warning: Ignoring unreadable cache file {_VALIDATE_CACHE_FILE}: {str(e)}", file=sys.stderr)
+        return {}
+    bucket = int(time.time() // _VALIDATE_TTL)
+    return {key: result for key, result in cache.items() if key[1] == bucket}
+
+
+_validate_disk = _load_validate_cache()  # (ticker, day_bucket) -> (is_valid, error)
+
+
+@atexit.register
+def _save_validate_cache():
+    if not _validate_disk:
+        return
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(_VALIDATE_CACHE_FILE, "wb") as fh:
+            pickle.dump(_validate_disk, fh)
+    except Exception as e:
+        print(f"Warning: Could not write cache file {_VALIDATE_CACHE_FILE}: {str(e)}", file=sys.stderr)
+
+
+@functools.lru_cache(maxsize=4096)
+def _validate_ticker_cached(ticker, day_bucket):
+    """Look up a ticker once per day bucket. Transient errors are raised so they aren't cached."""
+    key = (ticker, day_bucket)
+    if key in _validate_disk:
+        return _validate_disk[key]
+
+    try:
+        stock = yf.Ticker(ticker, session=_SESSION)
+        # fast_info skips the heavy quoteSummary request; only fetch .info to explain a failure
+        if _fast_last_price(stock):
+            result = (True, None)
+        else:
+            result = _check_ticker_info(stock.info)
+    except Exception as e:
+        if "404" not in str(e):
+            raise
+        result = (False, "Symbol not found")
+    _validate_disk[key] = result
+    return result
+
+
+def _fast_last_price(stock):
+    """Return the last price from yfinance's lightweight fast_info, or None if unavailable."""
+    try:
+        price = stock.fast_info.get('last_price')
+    except Exception:
+        return None
+    if price is None or pd.isna(price) or price <= 0:
+        return None
+    return price
+
+
+def _check_ticker_info(info):
+    """Classify a ticker from its yfinance info dict."""
+    # Check various error conditions
+    if 'regularMarketPrice' not in info or info['regularMarketPrice'] is None:
+        return False, "No price data available"
+    
+    if info.get('state') == 'DELISTED':
+        return False, f"Delisted on {info.get('delistedDate', 'unknown date')}"
         
-        if info.get('state') == 'DELISTED':
-            return False, f"Delisted on {info.get('delistedDate', 'unknown date')}"
-            
-        if info.get('quoteType') == 'NONE':
-            return False, "Invalid symbol"
+    if info.get('quoteType') == 'NONE':
+        return False, "Invalid symbol"
+    
+    # Additional checks for specific error conditions
+    if info.get('regularMarketPrice') == 0:
+        return False, "Zero price - possible trading halt or delisting"
         
-        # Additional checks for specific error conditions
-        if info.get('regularMarketPrice') == 0:
-            return False, "Zero price - possible trading halt or delisting"
-            
-        return True, None
+    return True, None
+
+
+def validate_ticker(ticker):
+    """Validate if a ticker is still active and suggest alternatives if needed."""
+    try:
+        return _validate_ticker_cached(ticker, int(time.time() // _VALIDATE_TTL))
     except Exception as e:
         error_msg = str(e)
-        if "404" in error_msg:
-            return False, "Symbol not found"
-        elif "timeout" in error_msg.lower():
+        if "timeout" in error_msg.lower():
             return False, "Connection timeout - try again later"
         return False, str(e)
 
 
+def _get_crumb():
+    """Fetch the session cookie and crumb that Yahoo's quote endpoint requires."""
+    global _crumb
+    if _crumb is None:
+        _SESSION.get("https://fc.yahoo.com", timeout=10)  # Sets the cookie; a 404 here is normal
+        resp = _SESSION.get(_CRUMB_URL, timeout=10)
+        resp.raise_for_status()
+        _crumb = resp.text.strip()
+    return _crumb
+
+
+def bulk_validate(symbols):
+    """Fetch quotes in 20-symbol requests. Returns {symbol: quote dict}; unknown symbols are absent."""
+    crumb = _get_crumb()
+    quotes = {}
+    for i in range(0, len(symbols), _QUOTE_CHUNK):
+        chunk = symbols[i:i + _QUOTE_CHUNK]
+        resp = _SESSION.get(_QUOTE_URL, params={'symbols': ','.join(chunk), 'crumb': crumb}, timeout=10)
+        resp.raise_for_status()
+        for quote in resp.json()['quoteResponse']['result']:
+            quotes[quote['symbol']] = quote
+    return quotes
+
+
+def validate_tickers(symbols):
+    """Validate many tickers with batched quote requests.
+
+    If the quote endpoint is unavailable, a batched price download confirms the
+    tickers it can, and only the rest get the detailed per-ticker lookup.
+    Returns (is_valid, error) tuples in input order.
+    """
+    bucket = int(time.time() // _VALIDATE_TTL)
+    pending = [t for t in symbols if (t, bucket) not in _validate_disk]
+    if pending:
+        try:
+            quotes = bulk_validate(pending)
+        except Exception as e:
+            print(f"Warning: Bulk quote lookup failed, checking tickers individually: {str(e)}", file=sys.stderr)
+            _confirm_by_download(pending, bucket)
+        else:
+            for ticker in pending:
+                quote = quotes.get(ticker)
+                _validate_disk[(ticker, bucket)] = _check_ticker_info(quote) if quote else (False, "Symbol not found")
+
+    # Lookups are network-bound, so run them concurrently and report in order
+    with ThreadPoolExecutor(max_workers=max(1, min(_MAX_WORKERS, len(symbols)))) as ex:
+        return list(ex.map(validate_ticker, symbols))
+
+
+def _confirm_by_download(symbols, bucket):
+    """Mark tickers with a positive recent close as valid, using one batched price download."""
+    try:
+        closes = _download_closes(symbols, period='5d', interval='1d')
+    except Exception as e:
+        print(f"Error downloading data: {type(e).__name__}: {e}", file=sys.stderr)
+        return
+    for ticker, close in closes.items():
+        if not close.empty and close.iloc[-1] > 0:
+            _validate_disk[(ticker, bucket)] = (True, None)
+
+
+# Known symbol changes for problematic tickers
+KNOWN_TICKER_UPDATES: dict[str, str] = {
+    # Merged/Acquired Companies
+    'CS': 'UBS',  # Credit Suisse was acquired by UBS
+    
+    # European Exchanges
+    'ALV': 'ALV.DE',    # Allianz SE (Deutsche Börse)
+    'BN': 'BN.PA',      # Danone (Euronext Paris)
+    'ENGI': 'ENGI.PA',  # Engie (Euronext Paris)
+    'EOAN': 'EOAN.DE',  # E.ON SE (Deutsche Börse)
+    'MUV2': 'MUV2.DE',  # Munich Re (Deutsche Börse)
+    'NESN': 'NESN.SW',  # Nestlé (SIX Swiss Exchange)
+    'RWE': 'RWE.DE',    # RWE AG (Deutsche Börse)
+    'UNA': 'UNA.AS',    # Unilever (Euronext Amsterdam)
+    'VIE': 'VIE.PA',    # Veolia (Euronext Paris)
+}
+
+# Exchange descriptions for error messages
+EXCHANGE_NAMES: dict[str, str] = {
+    'DE': 'Deutsche Börse (German Exchange)',
+    'PA': 'Euronext Paris',
+    'AS': 'Euronext Amsterdam',
+    'SW': 'SIX Swiss Exchange'
+}
+
+
+def _update_reason(suggested):
+    if '.' in suggested:  # If it's an exchange-specific symbol
+        exchange = suggested.split('.')[1]
+        return f"Listed on {EXCHANGE_NAMES.get(exchange, exchange)}"
+    return "Updated symbol after corporate action"
+
+
+# ticker -> (suggested symbol, reason), built once at import
+_KNOWN_UPDATES = {ticker: (suggested, _update_reason(suggested))
+                  for ticker, suggested in KNOWN_TICKER_UPDATES.items()}
+
+
 def suggest_ticker_update(ticker):
     """Suggest updates for problematic tickers with exchange suffixes."""
-    known_updates = {
-        # Merged/Acquired Companies
-        'CS': 'UBS',  # Credit Suisse was acquired by UBS
-        
-        # European Exchanges
-        'ALV': 'ALV.DE',    # Allianz SE (Deutsche Börse)
-        'BN': 'BN.PA',      # Danone (Euronext Paris)
-        'ENGI': 'ENGI.PA',  # Engie (Euronext Paris)
-        'EOAN': 'EOAN.DE',  # E.ON SE (Deutsche Börse)
-        'MUV2': 'MUV2.DE',  # Munich Re (Deutsche Börse)
-        'NESN': 'NESN.SW',  # Nestlé (SIX Swiss Exchange)
-        'RWE': 'RWE.DE',    # RWE AG (Deutsche Börse)
-        'UNA': 'UNA.AS',    # Unilever (Euronext Amsterdam)
-        'VIE': 'VIE.PA',    # Veolia (Euronext Paris)
-        
-        # Exchange descriptions for error messages
-        '_EXCHANGES': {
-            'DE': 'Deutsche Börse (German Exchange)',
-            'PA': 'Euronext Paris',
-            'AS': 'Euronext Amsterdam',
-            'SW': 'SIX Swiss Exchange'
-        }
-    }
-    
-    if ticker in known_updates:
-        suggested = known_updates[ticker]
-        if '.' in suggested:  # If it's an exchange-specific symbol
-            exchange = suggested.split('.')[1]
-            exchange_desc = known_updates['_EXCHANGES'].get(exchange, exchange)
-            return suggested, f"Listed on {exchange_desc}"
-        return suggested, "Updated symbol after corporate action"
-    return None, None
+    return _KNOWN_UPDATES.get(ticker, (None, None))
 
 
 # ----------------------------------------------------------------------
@@ -326,6 +1047,7 @@ def main():
     p.add_argument('--continuous', action='store_true', help='Run continuously')
     p.add_argument('--interval', type=int, default=300, help='Seconds between checks in continuous mode')
     p.add_argument('--limit', type=int, help='Limit to the top N tickers (useful for testing)')
+    p.add_argument('--debug', action='store_true', help='Print full tracebacks for errors')
     args = p.parse_args()
 
     symbols: list[str] = []
@@ -337,8 +1059,7 @@ def main():
         sys.exit("No tickers supplied. Use --tickers or --file")
 
     # de‑duplicate while preserving order
-    seen = set()
-    symbols = [x for x in symbols if not (x in seen or seen.add(x))]
+    symbols = list(dict.fromkeys(symbols))
     
     # Limit number of tickers if specified
     if args.limit and args.limit > 0 and args.limit < len(symbols):
@@ -348,66 +1069,76 @@ def main():
     if args.continuous:
         run_continuous_mode(symbols, args)
     else:
-        run_single_check(symbols, args.oversold, args.overbought)
+        run_single_check(symbols, args)
 
 
-def run_single_check(symbols, oversold_threshold, overbought_threshold):
+def run_single_check(symbols, args):
     """Run a single check on the provided symbols"""
     print("\nRunning single check...")
     try:
-        results = []
         alerts = []
+        # Parallel columns for display; NaN marks an error or missing data
+        tickers, prices, rsis, times = [], [], [], []
+        
+        # One timestamp for the whole scan
+        now_str = _now_str()
+        
+        # Fetch a download-sized chunk at a time; with more than one chunk, print each
+        # chunk's results as they arrive so progress shows before the sorted table at the end
+        print(f"Processing: {', '.join(symbols)}")
+        stream = len(symbols) > _DOWNLOAD_CHUNK
+        width = max(len(s) for s in symbols)
+        batch = {}
+        for i in range(0, len(symbols), _DOWNLOAD_CHUNK):
+            chunk = calculate_rsi_for_tickers(symbols[i:i + _DOWNLOAD_CHUNK], args.period, args.data_interval,
+                                              debug=args.debug, now_str=now_str)
+            if stream:
+                for ticker, rsi_data in chunk.items():
+                    if rsi_data:
+                        rsi = 'n/a' if math.isnan(rsi_data['rsi']) else f"{rsi_data['rsi']:.2f}"
+                        print(f"  {ticker:<{width}}  RSI {rsi:>6}  ${rsi_data['price']:.2f}")
+            batch.update(chunk)
         
-        # Process each symbol individually
         for ticker in symbols:
-            print(f"Processing: {ticker}")
             try:
-                # Fetch RSI data for the current ticker
-                # NOTE: We need period and interval args here. Let's use the defaults from main() for now.
-                # Consider passing args down or making them global if needed.
-                rsi_data = calculate_rsi_for_ticker(ticker, period="90d", interval="1d")
+                rsi_data = batch[ticker]
                 
                 if rsi_data:
                     # Check for signals
-                    alert_msg = check_rsi_signals(rsi_data, oversold_threshold, overbought_threshold)
+                    alert_msg = check_rsi_signals(rsi_data, args.oversold, args.overbought)
                     if alert_msg:
                         alerts.append(alert_msg)
                     
                     # Store result for display
-                    results.append({
-                        'Ticker': ticker,
-                        'RSI': rsi_data['rsi'],
-                        'Price': rsi_data['price'],
-                        'Time': rsi_data['time']
-                    })
-                else:
-                    results.append({
-                        'Ticker': ticker,
-                        'RSI': float('nan'), # Indicate error or missing data
-                        'Price': float('nan'),
-                        'Time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    })
+                    tickers.append(ticker)
+                    rsis.append(rsi_data['rsi'])
+                    prices.append(rsi_data['price'])
+                    times.append(rsi_data['time'])
+                    continue
 
             except Exception as e:
-                print(f"Error processing {ticker}: {str(e)}")
-                results.append({
-                    'Ticker': ticker,
-                    'RSI': float('nan'), # Indicate error
-                    'Price': float('nan'),
-                    'Time': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                })
+                print(f"Error processing {ticker}: {type(e).__name__}: {e}", file=sys.stderr)
+                if args.debug:
+                    traceback.print_exc()
+            tickers.append(ticker)
+            rsis.append(float('nan'))
+            prices.append(float('nan'))
+            times.append(now_str)
         
         # Create DataFrame for display
-        if results:
-            df = pd.DataFrame(results)
-            df['Time'] = pd.to_datetime(df['Time'])
-            # Format Price and RSI for display AFTER sorting
-            df = df.sort_values('RSI', na_position='last') # Sort by RSI, errors last
+        if tickers:
+            rsi_arr = np.array(rsis, dtype=np.float64)
+            price_arr = np.array(prices, dtype=np.float64)
+            order = np.argsort(rsi_arr, kind='stable')  # Sort by RSI, errors (NaN) last
+            rsi_arr, price_arr = rsi_arr[order], price_arr[order]
             
-            # Apply formatting
-            df['Price'] = df['Price'].apply(lambda x: f"${x:.2f}" if pd.notna(x) else 'n/a')
-            df['RSI'] = df['RSI'].apply(lambda x: f"{x:.2f}" if pd.notna(x) else 'n/a')
-            df['Time'] = df['Time'].dt.strftime('%Y-%m-%d %H:%M:%S')
+            # Format whole columns at once rather than per row
+            df = pd.DataFrame({
+                'Ticker': [tickers[i] for i in order],
+                'RSI': np.where(np.isnan(rsi_arr), 'n/a', np.char.mod('%.2f', rsi_arr)),
+                'Price': np.where(np.isnan(price_arr), 'n/a', np.char.add('$', np.char.mod('%.2f', price_arr))),
+                'Time': [times[i] for i in order],
+            })
             
             # Display results
             print("\nRSI Results:")
@@ -425,13 +1156,15 @@ def run_single_check(symbols, oversold_threshold, overbought_threshold):
                 print(alert)
                 
             # Send SMS alert using Twilio (combined message)
-            alert_twilio(alert_message)
+            queue_alert(alert_twilio, alert_message)
             
             # Send email alert (using combined message as body)
-            alert_email('RSI Screener Alert', alert_message)
+            queue_alert(alert_email, 'RSI Screener Alert', alert_message)
             
     except Exception as e:
-        print(f"Error during check: {str(e)}")
+        print(f"Error during check: {type(e).__name__}: {e}", file=sys.stderr)
+        if args.debug:
+            traceback.print_exc()
 
 
 def run_continuous_mode(symbols, args):
@@ -442,16 +1175,22 @@ def run_continuous_mode(symbols, args):
     invalid_symbols = []
     print("\nValidating tickers...")
     
-    for ticker in symbols:
-        is_valid, error = validate_ticker(ticker)
+    validations = validate_tickers(symbols)
+    
+    # Validate the suggested replacements for all invalid tickers in one batch
+    suggestions = [suggest_ticker_update(ticker)[0] for ticker, (is_valid, _) in zip(symbols, validations)
+                   if not is_valid]
+    suggestions = list(dict.fromkeys(s for s in suggestions if s))
+    suggested_validations = dict(zip(suggestions, validate_tickers(suggestions))) if suggestions else {}
+    
+    for ticker, (is_valid, error) in zip(symbols, validations):
         if not is_valid:
             suggestion, reason = suggest_ticker_update(ticker)
             print(f"\n⚠️  Warning: {ticker} - {error}")
             if suggestion:
                 print(f"   Suggestion: Use {suggestion} instead")
                 print(f"   Reason: {reason}")
-                # Try validating the suggested ticker
-                is_suggested_valid, suggested_error = validate_ticker(suggestion)
+                is_suggested_valid, suggested_error = suggested_validations[suggestion]
                 if is_suggested_valid:
                     print(f"   ✅ Verified: {suggestion} is valid")
                     valid_symbols.append(suggestion)
@@ -479,62 +1218,79 @@ def run_continuous_mode(symbols, args):
     print(f"Checking every {args.interval} seconds")
     print("----------------------------------------")
     
+    # Wilder averages per ticker, carried between checks so RSI is updated incrementally
+    rsi_state = {}
+    
+    # Status table columns, allocated once and refilled on every check
+    prices = np.full(len(valid_symbols), np.nan)
+    rsis = np.full(len(valid_symbols), np.nan)
+    signals = np.empty(len(valid_symbols), dtype=object)
+    width = max(len('Symbol'), *(len(s) for s in valid_symbols))
+    
+    # Alerts from consecutive scans are coalesced into one email
+    alerter = BatchedAlerter(functools.partial(queue_alert, alert_email, 'RSI Screener Alert'))
+    
+    # Ctrl+C ends the wait between checks immediately; a second Ctrl+C aborts a running check
+    def request_stop(signum, frame):
+        _stop.set()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    
+    signal.signal(signal.SIGINT, request_stop)
+    next_deadline = time.monotonic()
+    
     try:
-        while True:
-            print(f"\nChecking RSI levels - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        while not _stop.is_set():
+            now_str = _now_str()
+            print(f"\nChecking RSI levels - {now_str}")
             
-            alerts = []
-            rows = []  # Store data for table display
+            prices.fill(np.nan)
+            rsis.fill(np.nan)
             
-            for ticker in valid_symbols:
+            batch = calculate_rsi_for_tickers(valid_symbols, args.period, args.data_interval,
+                                              state=rsi_state, debug=args.debug, now_str=now_str)
+            for i, ticker in enumerate(valid_symbols):
                 try:
-                    rsi_data = calculate_rsi_for_ticker(ticker, args.period, args.data_interval)
-                    if rsi_data:
-                        status = '-'
-                        alert_msg = check_rsi_signals(rsi_data, args.oversold, args.overbought)
-                        if alert_msg:
-                            alerts.append(alert_msg)
-                            status = "OVERBOUGHT" if rsi_data['rsi'] >= args.overbought else "OVERSOLD"
-                        
-                        rows.append({
-                            'Symbol': ticker,
-                            'Price': f"${rsi_data['price']:.2f}",
-                            'RSI': rsi_data['rsi'],  # Store as float for sorting
-                            'Signal': status
-                        })
+                    rsi_data = batch[ticker]
+                    if not rsi_data:
+                        raise ValueError("no data")
+                    status = '-'
+                    if rsi_data['rsi'] >= args.overbought:
+                        status = "OVERBOUGHT"
+                    elif rsi_data['rsi'] <= args.oversold:
+                        status = "OVERSOLD"
+                    alert_msg = check_rsi_signals(rsi_data, args.oversold, args.overbought)
+                    if alert_msg:
+                        alerter.add(alert_msg)
+                    
+                    prices[i] = rsi_data['price']
+                    rsis[i] = rsi_data['rsi']
+                    signals[i] = status
                 except Exception as e:
                     error_msg = str(e)
                     if len(error_msg) > 50:  # Truncate long error messages
                         error_msg = error_msg[:47] + "..."
-                    rows.append({
-                        'Symbol': ticker,
-                        'Price': 'n/a',
-                        'RSI': float('-inf'),  # Use -inf for sorting errors to bottom
-                        'Signal': f'ERROR: {error_msg}'
-                    })
-            
-            # Print current status table
-            if rows:
-                df = pd.DataFrame(rows)
-                # Sort by RSI in descending order
-                df = df.sort_values('RSI', ascending=False)
-                # Format RSI after sorting
-                df['RSI'] = df['RSI'].apply(lambda x: f"{x:.1f}" if x != float('-inf') else 'n/a')
-                print("\nCurrent Status (Sorted by RSI):")
-                print(df.to_string(index=False))
+                    signals[i] = f'ERROR: {error_msg}'
             
-            # Send alerts to Slack/email if any
-            if alerts:
-                message = '\n'.join(alerts)
-                alert_email('RSI Screener Alert', message)
+            # Print current status table, sorted by RSI descending with errors (NaN) last
+            order = np.argsort(-rsis, kind='stable')
+            lines = [f"{'Symbol':>{width}}     Price   RSI Signal"]
+            for i in order:
+                price = f"${prices[i]:.2f}" if not np.isnan(prices[i]) else 'n/a'
+                rsi = f"{rsis[i]:.1f}" if not np.isnan(rsis[i]) else 'n/a'
+                lines.append(f"{valid_symbols[i]:>{width}} {price:>9} {rsi:>5} {signals[i]}")
+            print("\nCurrent Status (Sorted by RSI):")
+            print('\n'.join(lines))
             
-            # Wait before next check
-            wait_time = args.interval
-            print(f"\nWaiting {wait_time} seconds before next check...")
-            time.sleep(wait_time)
+            # Schedule from the previous start so the interval doesn't drift by the check duration
+            next_deadline = max(next_deadline + args.interval, time.monotonic())
+            wait_time = max(0.0, next_deadline - time.monotonic())
+            print(f"\nWaiting {wait_time:.0f} seconds before next check...")
+            _stop.wait(wait_time)
             
     except KeyboardInterrupt:
-        print("\nRSI Screener stopped by user")
+        pass
+    print("\nRSI Screener stopped by user")
+    alerter.flush()
 
 
 if __name__ == '__main__':